@@ -37,7 +37,7 @@ class AIComponent(Component):
         self.decision_interval = 0.1  # Make decisions every 100ms
         
         # Movement behavior
-        self.patrol_start = None
+        self.patrol_start_x = None  # Only x matters for horizontal patrol
         self.patrol_direction = 1
         self.move_speed = 1.0
         
@@ -15,6 +15,13 @@ class InkDropComponent(Component):
         self.collected = False      # Whether this drop has been collected
         self.is_player_death_drop = False  # Whether this is from player death
         
+    def reset(self, ink_value, lifetime):
+        """Reset drop state so a pooled entity can be reused"""
+        self.ink_value = ink_value
+        self.lifetime = lifetime
+        self.max_lifetime = lifetime
+        self.collected = False
+        
     def update(self, dt):
         """Update ink drop (decrease lifetime)"""
         if self.lifetime > 0:
@@ -25,6 +25,9 @@ class Physics(Component):
         self.on_ground = False
         self.can_jump = True
         self.affected_by_gravity = True
+        self.ground_bounds = None  # Terrain bounds last found underfoot (ground probe cache)
+        self.ground_probe_position = None  # (x, y) where ground_bounds was last confirmed
+        self.ground_grid_version = None  # static_grid.version when ground_bounds was found
         
         # Forces (for knockback, wind, etc.)
         self.forces = pygame.Vector2(0, 0)
@@ -39,7 +42,7 @@ class Physics(Component):
     
     def reset_forces(self):
         """Reset forces for next frame"""
-        self.forces = pygame.Vector2(0, 0)
+        self.forces.update(0, 0)
     
     def apply_friction(self):
         """Apply friction based on ground state"""
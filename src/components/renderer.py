@@ -3,14 +3,14 @@ Renderer component for visual representation
 """
 import pygame
 from src.components.component import Component
-from enum import Enum
+from enum import IntEnum
 
 
-class RenderShape(Enum):
-    """Rendering shape types"""
-    RECTANGLE = "rectangle"
-    CIRCLE = "circle"
-    TRIANGLE = "triangle"
+class RenderShape(IntEnum):
+    """Rendering shape types (values index RenderSystem's shape dispatch table)"""
+    RECTANGLE = 0
+    CIRCLE = 1
+    TRIANGLE = 2
 
 
 class Renderer(Component):
@@ -37,6 +37,7 @@ class Renderer(Component):
         self.scale = pygame.Vector2(1, 1)
         self.flip_x = False
         self.flip_y = False
+        self._surface_cache = {}  # (shape, size, color, alpha) -> pre-rendered Surface, filled by RenderSystem
         
         # Particle effects
         self.particle_effect = None
@@ -39,6 +39,7 @@ STAMINA_DASH_COST = 25
 
 # Debug settings
 DEBUG_INFINITE_STAMINA = True  # Set to False for normal stamina behavior
+DEBUG_PHYSICS_LOGGING = False  # Print ground state transitions from PhysicsSystem
 
 # Combat settings
 PROJECTILE_SPEED = 800.0  # Much faster projectiles
@@ -13,6 +13,10 @@ class Entity:
         self.id = entity_id
         self.components: Dict[Type[Component], Component] = {}
         self.active = True
+        
+        # Flags read in per-frame loops; defaults avoid hasattr() probes
+        self.projectile_data = None  # Set by shooting/AI systems on projectiles
+        self.dashing = False         # Set by MovementSystem during a dash
     
     def add_component(self, component: Component):
         """Add a component to this entity"""
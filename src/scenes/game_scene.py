@@ -233,6 +233,17 @@ class GameScene:
             for system in self.systems:
                 system.remove_entity(entity)
     
+    def remove_entities(self, entities: List[Entity]):
+        """Remove several entities with a single pass over the entity list"""
+        doomed = {id(entity) for entity in entities}
+        removed = [entity for entity in self.entities if id(entity) in doomed]
+        if not removed:
+            return
+        self.entities[:] = [entity for entity in self.entities if id(entity) not in doomed]
+        for entity in removed:
+            for system in self.systems:
+                system.remove_entity(entity)
+    
     def update(self, dt: float):
         """Update scene"""
         # Update stamina and health for all entities
@@ -251,8 +262,8 @@ class GameScene:
         
         # Clean up inactive entities
         inactive_entities = [entity for entity in self.entities if not entity.active]
-        for entity in inactive_entities:
-            self.remove_entity(entity)
+        if inactive_entities:
+            self.remove_entities(inactive_entities)
     
     def render(self, screen: pygame.Surface):
         """Render scene"""
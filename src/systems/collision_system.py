@@ -6,6 +6,16 @@ from src.systems.system import System
 from src.components.transform import Transform
 from src.components.collision import Collision, CollisionType, CollisionShape
 from src.components.physics import Physics
+from src.components.health import Health
+from src.utils.spatial_hash import SpatialHashGrid
+
+# Cell size for the static terrain grid (~2x a typical tile)
+TERRAIN_CELL_SIZE = 64
+
+# Projectile broadphase: cells sized so large terrain bounds still span only a few cells
+PROJECTILE_CELL_SIZE = 64
+# Below this many projectile x entity pairs the plain pair loop beats building the grid
+PROJECTILE_GRID_MIN_PAIRS = 32 * 32
 
 
 class CollisionSystem(System):
@@ -16,16 +26,71 @@ class CollisionSystem(System):
         self.collision_pairs = []
         self.scene = scene
         
+        # Static solid terrain (solid collision, no physics) indexed for ground probes
+        self.static_grid = SpatialHashGrid(TERRAIN_CELL_SIZE)
+        
+        # Projectiles re-bucketed every frame once there are enough of them
+        self.projectile_grid = SpatialHashGrid(PROJECTILE_CELL_SIZE)
+        
+        # Projectile hits found during the pair sweep, applied after it (one per projectile)
+        self._pending_hits = []
+        self._hit_projectiles = {}  # id(projectile) -> index of its hit in _pending_hits
+        
     def update(self, dt: float):
         """Update collision detection and response"""
         self.collision_pairs.clear()
         
-        # Broad phase: check all collision pairs
-        for i, entity1 in enumerate(self.entities):
-            for j, entity2 in enumerate(self.entities[i+1:], i+1):
-                if self._check_collision(entity1, entity2):
-                    self.collision_pairs.append((entity1, entity2))
-                    self._handle_collision(entity1, entity2)
+        projectiles = [entity for entity in self.entities if entity.projectile_data is not None]
+        others = len(self.entities) - len(projectiles)
+        if len(projectiles) * others >= PROJECTILE_GRID_MIN_PAIRS:
+            self._update_with_projectile_grid(projectiles)
+        else:
+            # Broad phase: check all collision pairs
+            for i, entity1 in enumerate(self.entities):
+                for entity2 in self.entities[i+1:]:
+                    self._check_pair(entity1, entity2)
+        
+        # Damage, deaths and ink drop spawns happen after iteration, never mid-sweep
+        self._resolve_hits()
+    
+    def _update_with_projectile_grid(self, projectiles):
+        """Pair loop over non-projectiles; projectiles are only tested against nearby grid cells"""
+        index = self._index
+        grid = self.projectile_grid
+        grid.clear()
+        for projectile in projectiles:
+            collision = projectile.get_component(Collision)
+            transform = projectile.get_component(Transform)
+            grid.insert(projectile, collision.get_bounds(transform.position))
+        
+        others = [entity for entity in self.entities if entity.projectile_data is None]
+        for i, entity1 in enumerate(others):
+            for entity2 in others[i+1:]:
+                self._check_pair(entity1, entity2)
+        
+        # Every entity (projectiles included, for projectile-projectile hits) queries
+        # the projectile cells it overlaps; each pair is checked once, in list order
+        for entity in self.entities:
+            collision = entity.get_component(Collision)
+            transform = entity.get_component(Transform)
+            entity_index = index[id(entity)]
+            is_projectile = entity.projectile_data is not None
+            for projectile in grid.query(collision.get_bounds(transform.position)):
+                if projectile is entity:
+                    continue
+                projectile_index = index[id(projectile)]
+                if is_projectile and projectile_index < entity_index:
+                    continue  # Already checked from the other projectile
+                if projectile_index < entity_index:
+                    self._check_pair(projectile, entity)
+                else:
+                    self._check_pair(entity, projectile)
+    
+    def _check_pair(self, entity1, entity2):
+        """Narrow phase and response for one candidate pair"""
+        if self._check_collision(entity1, entity2):
+            self.collision_pairs.append((entity1, entity2))
+            self._handle_collision(entity1, entity2)
     
     def _check_collision(self, entity1, entity2):
         """Check if two entities are colliding"""
@@ -118,7 +183,7 @@ class CollisionSystem(System):
             return
         
         # Skip collision resolution for projectiles
-        if hasattr(entity1, 'projectile_data') or hasattr(entity2, 'projectile_data'):
+        if entity1.projectile_data is not None or entity2.projectile_data is not None:
             return
         
         # Determine which entity has physics (usually the player)
@@ -286,9 +351,6 @@ class CollisionSystem(System):
     def _create_ink_drop_from_enemy(self, enemy_entity):
         """Create ink drop when enemy dies"""
         from src.components.enemy_type import EnemyType
-        from src.components.ink_drop import InkDropComponent
-        from src.components.renderer import Renderer, RenderShape
-        from src.core.settings import COLORS
         
         # Only create ink drops for enemies (have EnemyType component)
         enemy_type = enemy_entity.get_component(EnemyType)
@@ -300,39 +362,11 @@ class CollisionSystem(System):
         if not enemy_transform:
             return
         
-        # Create ink drop entity
-        ink_drop = self.scene.create_entity()
-        
-        # Add transform at enemy position
-        ink_drop.add_component(Transform(enemy_transform.position.x, enemy_transform.position.y))
-        
-        # Add physics for bouncing effect
-        ink_drop.add_component(Physics(mass=0.5, friction=0.7, gravity_scale=0.5))
-        
-        # Add solid collision so it doesn't fall through ground
-        ink_drop.add_component(Collision(
-            width=12, height=12, 
-            collision_type=CollisionType.SOLID
-        ))
-        
-        # Add purple renderer
-        ink_drop.add_component(Renderer(
-            color=COLORS['ink_drop'],
-            size=(12, 12),
-            shape=RenderShape.CIRCLE
-        ))
-        
-        # Add ink drop component with enemy's ink value
-        ink_drop.add_component(InkDropComponent(
-            ink_value=enemy_type.ink_value,
-            lifetime=30.0  # 30 seconds before despawn
-        ))
-        
-        # Add to appropriate systems
-        self.scene.physics_system.add_entity(ink_drop)
-        self.scene.collision_system.add_entity(ink_drop)
-        self.scene.render_system.add_entity(ink_drop)
-        self.scene.ink_system.add_entity(ink_drop)
+        # Spawn ink drop (reuses a pooled entity when available)
+        self.scene.ink_system.acquire_ink_drop(
+            enemy_transform.position.x, enemy_transform.position.y,
+            enemy_type.ink_value
+        )
         
         print(f"[INK] Created ink drop worth {enemy_type.ink_value} ink at position ({enemy_transform.position.x:.1f}, {enemy_transform.position.y:.1f})")
     
@@ -343,32 +377,46 @@ class CollisionSystem(System):
         target_entity = None
         
         # Check if either entity is a projectile
-        if hasattr(entity1, 'projectile_data'):
+        if entity1.projectile_data is not None:
             projectile_entity = entity1
             target_entity = entity2
-        elif hasattr(entity2, 'projectile_data'):
+        elif entity2.projectile_data is not None:
             projectile_entity = entity2
             target_entity = entity1
         
-        # If we have a projectile collision, handle it through the shooting system
+        # If we have a projectile collision, stage the hit; it is applied once the sweep has finished
         if projectile_entity and target_entity:
-            # Get the shooting system from the scene to handle projectile collision
-            # We'll need to find a way to access the shooting system
-            from src.scenes.game_scene import GameScene
-            # For now, let's handle damage directly here
-            self._handle_projectile_damage(projectile_entity, target_entity)
+            self._queue_hit(projectile_entity, target_entity)
     
-    def _handle_projectile_damage(self, projectile, target):
-        """Handle projectile hitting a target"""
-        if not hasattr(projectile, 'projectile_data'):
-            return
-            
+    def _queue_hit(self, projectile, target):
+        """Record a projectile hit to apply after the collision sweep"""
         # Don't hit the owner
         if projectile.projectile_data.owner == target:
             return
             
+        # A projectile is spent by one target, but a damageable target wins over
+        # terrain it also overlaps, whichever the sweep found first
+        index = self._hit_projectiles.get(id(projectile))
+        if index is not None:
+            queued_target = self._pending_hits[index][1]
+            if target.has_component(Health) and not queued_target.has_component(Health):
+                self._pending_hits[index] = (projectile, target)
+            return
+        self._hit_projectiles[id(projectile)] = len(self._pending_hits)
+        self._pending_hits.append((projectile, target))
+    
+    def _resolve_hits(self):
+        """Apply all staged projectile hits in the order they were found"""
+        if not self._pending_hits:
+            return
+        for projectile, target in self._pending_hits:
+            self._apply_hit(projectile, target)
+        self._pending_hits.clear()
+        self._hit_projectiles.clear()
+    
+    def _apply_hit(self, projectile, target):
+        """Handle projectile hitting a target"""
         # Deal damage to target
-        from src.components.health import Health
         target_health = target.get_component(Health)
         if target_health:
             damage_dealt = target_health.take_damage(projectile.projectile_data.damage)
@@ -411,6 +459,17 @@ class CollisionSystem(System):
         if (entity.has_component(Transform) and 
             entity.has_component(Collision)):
             super().add_entity(entity)
+            
+            collision = entity.get_component(Collision)
+            if (collision.collision_type == CollisionType.SOLID and
+                not entity.has_component(Physics)):
+                transform = entity.get_component(Transform)
+                self.static_grid.insert(entity, collision.get_bounds(transform.position))
+    
+    def remove_entity(self, entity):
+        """Remove entity and drop it from the static terrain grid"""
+        super().remove_entity(entity)
+        self.static_grid.remove(entity)
     
     def check_collision_at_position(self, entity, position):
         """Check if entity would collide at given position"""
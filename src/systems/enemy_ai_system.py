@@ -9,8 +9,10 @@ from src.components.physics import Physics
 from src.components.health import Health
 from src.components.ai_component import AIComponent, AIState
 from src.components.enemy_type import EnemyType, EnemyTypeEnum
-from src.components.collision import Collision, CollisionType
-from src.core.settings import PROJECTILE_SPEED
+from src.core.settings import PROJECTILE_SPEED, KNOCKBACK_FORCE
+
+# States that a lost target does not interrupt
+_PASSIVE_STATES = frozenset((AIState.PATROL, AIState.IDLE, AIState.CHARGING))
 
 
 class EnemyAISystem(System):
@@ -20,6 +22,17 @@ class EnemyAISystem(System):
         super().__init__()
         self.scene = scene
         self.player_entity = None
+        self._player_transform = None  # Resolved once per frame in update()
+        
+        # State dispatch table (replaces an if/elif ladder per enemy per frame)
+        self._state_handlers = {
+            AIState.IDLE: self._execute_idle,
+            AIState.PATROL: self._execute_patrol,
+            AIState.CHASE: self._execute_chase,
+            AIState.ATTACK: self._execute_attack,
+            AIState.CHARGING: self._execute_charging,
+            AIState.STUNNED: self._execute_stunned,
+        }
         
     def set_player(self, player_entity):
         """Set the player entity for AI targeting"""
@@ -27,6 +40,10 @@ class EnemyAISystem(System):
         
     def update(self, dt: float):
         """Update AI for all enemy entities"""
+        # Look up the player's transform once instead of once per enemy query
+        self._player_transform = (self.player_entity.get_component(Transform)
+                                  if self.player_entity else None)
+        
         for entity in self.entities:
             ai = entity.get_component(AIComponent)
             enemy_type = entity.get_component(EnemyType)
@@ -37,6 +54,22 @@ class EnemyAISystem(System):
             # Update AI timers
             ai.update_timers(dt)
             
+            # Fast path: patrolling with the player out of detection range
+            if ai.state == AIState.PATROL and self._player_transform:
+                transform = entity.get_component(Transform)
+                physics = entity.get_component(Physics)
+                if transform and physics:
+                    dx = self._player_transform.position.x - transform.position.x
+                    dy = self._player_transform.position.y - transform.position.y
+                    detection_range = enemy_type.detection_range
+                    if dx * dx + dy * dy > detection_range * detection_range:
+                        # Same outcome as a full decision: drop target, keep patrolling
+                        if ai.can_make_decision():
+                            ai.clear_target()
+                            ai.reset_decision_timer()
+                        self._patrol_step(ai, enemy_type, transform, physics)
+                        continue
+            
             # Make AI decisions
             if ai.can_make_decision():
                 self._make_ai_decision(entity, ai, enemy_type)
@@ -78,23 +111,14 @@ class EnemyAISystem(System):
                 ai.clear_target()
             
             # Don't interrupt charging even if player goes out of detection range
-            if ai.state not in [AIState.PATROL, AIState.IDLE, AIState.CHARGING]:
+            if ai.state not in _PASSIVE_STATES:
                 ai.set_state(AIState.PATROL)
                 
     def _execute_ai_state(self, entity, ai, enemy_type, dt):
         """Execute the current AI state"""
-        if ai.state == AIState.IDLE:
-            self._execute_idle(entity, ai, enemy_type, dt)
-        elif ai.state == AIState.PATROL:
-            self._execute_patrol(entity, ai, enemy_type, dt)
-        elif ai.state == AIState.CHASE:
-            self._execute_chase(entity, ai, enemy_type, dt)
-        elif ai.state == AIState.ATTACK:
-            self._execute_attack(entity, ai, enemy_type, dt)
-        elif ai.state == AIState.CHARGING:
-            self._execute_charging(entity, ai, enemy_type, dt)
-        elif ai.state == AIState.STUNNED:
-            self._execute_stunned(entity, ai, enemy_type, dt)
+        handler = self._state_handlers.get(ai.state)
+        if handler:
+            handler(entity, ai, enemy_type, dt)
             
     def _execute_idle(self, entity, ai, enemy_type, dt):
         """Execute idle behavior"""
@@ -109,13 +133,17 @@ class EnemyAISystem(System):
         if not transform or not physics:
             return
             
+        self._patrol_step(ai, enemy_type, transform, physics)
+        
+    def _patrol_step(self, ai, enemy_type, transform, physics):
+        """Advance patrol movement for one frame"""
         # Initialize patrol start position
-        if ai.patrol_start is None:
-            ai.patrol_start = transform.position.copy()
+        if ai.patrol_start_x is None:
+            ai.patrol_start_x = transform.position.x
             
         # Calculate patrol movement
         patrol_range = enemy_type.get_patrol_range()
-        current_distance = abs(transform.position.x - ai.patrol_start.x)
+        current_distance = abs(transform.position.x - ai.patrol_start_x)
         
         # Change direction if we've reached patrol limit
         if current_distance >= patrol_range:
@@ -138,10 +166,14 @@ class EnemyAISystem(System):
             return
             
         # Move towards target
-        direction = self._get_direction_to_player(entity)
-        if direction.length() > 0:
-            direction.normalize_ip()
-            physics.velocity.x = direction.x * enemy_type.move_speed
+        offset = self._get_offset_to_player(entity)
+        if offset is None:
+            return
+            
+        dx, dy = offset
+        length = math.hypot(dx, dy)
+        if length > 0:
+            physics.velocity.x = dx / length * enemy_type.move_speed
             
     def _execute_attack(self, entity, ai, enemy_type, dt):
         """Execute attack behavior"""
@@ -210,7 +242,6 @@ class EnemyAISystem(System):
         distance_to_target = self._get_distance_to_player(entity)
         if distance_to_target <= enemy_type.attack_range:
             # Deal damage directly to the target
-            from src.components.health import Health
             target_health = ai.target.get_component(Health)
             if target_health:
                 damage_dealt = target_health.take_damage(enemy_type.damage)
@@ -224,12 +255,12 @@ class EnemyAISystem(System):
                         target_transform = ai.target.get_component(Transform)
                         
                         if entity_transform and target_transform:
-                            knockback_direction = target_transform.position - entity_transform.position
-                            if knockback_direction.length() > 0:
-                                knockback_direction.normalize_ip()
-                                # Apply knockback force
-                                from src.core.settings import KNOCKBACK_FORCE
-                                target_physics.add_impulse(knockback_direction * KNOCKBACK_FORCE)
+                            # Single sqrt; the epsilon keeps overlapping positions finite
+                            dx = target_transform.position.x - entity_transform.position.x
+                            dy = target_transform.position.y - entity_transform.position.y
+                            inv_len = KNOCKBACK_FORCE / math.sqrt(dx * dx + dy * dy + 1e-12)
+                            # Apply knockback force
+                            target_physics.add_impulse(pygame.Vector2(dx * inv_len, dy * inv_len))
                 
                 # Stun the attacker briefly after successful melee attack
                 ai.set_state(AIState.STUNNED, 0.3)
@@ -274,89 +305,55 @@ class EnemyAISystem(System):
         if not owner_transform:
             return
             
-        # Create projectile entity
-        projectile = self.scene.create_entity()
-        
-        # Position projectile at owner's position
-        projectile_pos = owner_transform.position.copy()
-        projectile.add_component(Transform(projectile_pos.x, projectile_pos.y))
-        
-        # Add physics with velocity in aim direction
-        from src.components.physics import Physics
-        physics = Physics(mass=0.1, friction=1.0, gravity_scale=0)
-        
         # Charged shots are slower but more powerful
         projectile_speed = PROJECTILE_SPEED * 0.6 if is_charged else PROJECTILE_SPEED
-        physics.velocity = direction * projectile_speed
-        physics.affected_by_gravity = False
-        physics.max_speed = projectile_speed + 100
-        projectile.add_component(physics)
         
-        # Add collision (much larger for charged shots)
-        collision_size = 16 if is_charged else 6
-        projectile.add_component(Collision(
-            width=collision_size, height=collision_size,
-            collision_type=CollisionType.DAMAGE
-        ))
-        
-        # Add renderer (highly distinctive colors and sizes for charged shots)
-        from src.components.renderer import Renderer, RenderShape
-        from src.core.settings import COLORS
+        # Highly distinctive colors and sizes for charged shots (collision matches visible size)
         if is_charged:
             projectile_color = (255, 255, 100)  # Bright yellow for charged shots
-            projectile_size = (16, 16)  # Much larger
+            projectile_size = 16  # Much larger
         else:
             projectile_color = (255, 100, 100)  # Red-ish for normal enemy projectiles
-            projectile_size = (6, 6)
-            
-        projectile.add_component(Renderer(
-            color=projectile_color,
-            size=projectile_size,
-            shape=RenderShape.CIRCLE
-        ))
+            projectile_size = 6
         
-        # Add projectile-specific component
-        from src.systems.shooting_system import ProjectileComponent
-        projectile.projectile_data = ProjectileComponent(
-            lifetime=2.0,
+        # Shooting system owns projectile pooling and lifetime management
+        self.scene.shooting_system.acquire_projectile(
+            owner,
+            owner_transform.position.x, owner_transform.position.y,
+            direction.x * projectile_speed, direction.y * projectile_speed,
+            size=projectile_size,
+            color=projectile_color,
             damage=damage,
-            owner=owner
+            lifetime=2.0,
+            max_speed=projectile_speed + 100
         )
+            
+    def _get_offset_to_player(self, entity):
+        """Get (dx, dy) from entity to player as plain floats"""
+        player_transform = self._player_transform
+        entity_transform = entity.get_component(Transform)
         
-        # Add to systems
-        self.scene.physics_system.add_entity(projectile)
-        self.scene.collision_system.add_entity(projectile)
-        self.scene.render_system.add_entity(projectile)
-        
-        # Add to shooting system for lifetime management
-        if hasattr(self.scene, 'shooting_system'):
-            self.scene.shooting_system.projectiles.append(projectile)
+        if not player_transform or not entity_transform:
+            return None
             
+        return (player_transform.position.x - entity_transform.position.x,
+                player_transform.position.y - entity_transform.position.y)
+        
     def _get_distance_to_player(self, entity):
         """Get distance from entity to player"""
-        if not self.player_entity:
-            return float('inf')
-            
-        entity_transform = entity.get_component(Transform)
-        player_transform = self.player_entity.get_component(Transform)
-        
-        if not entity_transform or not player_transform:
+        offset = self._get_offset_to_player(entity)
+        if offset is None:
             return float('inf')
             
-        return entity_transform.position.distance_to(player_transform.position)
+        return math.hypot(*offset)
         
     def _get_direction_to_player(self, entity):
         """Get direction vector from entity to player"""
-        if not self.player_entity:
-            return pygame.Vector2(0, 0)
-            
-        entity_transform = entity.get_component(Transform)
-        player_transform = self.player_entity.get_component(Transform)
-        
-        if not entity_transform or not player_transform:
+        offset = self._get_offset_to_player(entity)
+        if offset is None:
             return pygame.Vector2(0, 0)
             
-        return player_transform.position - entity_transform.position
+        return pygame.Vector2(offset)
     
     def _reset_enemy_color(self, entity, enemy_type):
         """Reset enemy color to default"""
@@ -5,6 +5,15 @@ from src.systems.system import System
 from src.components.ink_drop import InkDropComponent
 from src.components.health import Health
 from src.components.ink_currency import InkCurrency
+from src.components.transform import Transform
+from src.components.stamina import Stamina
+from src.components.physics import Physics
+from src.components.collision import Collision, CollisionType
+from src.components.renderer import Renderer, RenderShape
+from src.core.settings import COLORS
+
+INK_DROP_LIFETIME = 30.0  # Seconds before an uncollected drop despawns
+BLOODSTAIN_LIFETIME = 999999.0  # Effectively infinite - only removed by collection or replacement
 
 
 class InkSystem(System):
@@ -13,6 +22,7 @@ class InkSystem(System):
     def __init__(self, scene):
         super().__init__()
         self.scene = scene
+        self._drop_pool = []  # Expired/collected ink drop entities ready for reuse
         
     def update(self, dt: float):
         """Update ink system"""
@@ -24,15 +34,84 @@ class InkSystem(System):
     
     def _update_ink_drops(self, dt):
         """Update ink drop lifetimes and remove expired ones"""
-        for entity in self.entities[:]:  # Copy list to avoid modification during iteration
+        # Index walk with swap-remove: no list copy, O(1) per expired drop
+        entities = self.entities
+        i = 0
+        while i < len(entities):
+            entity = entities[i]
             ink_drop = entity.get_component(InkDropComponent)
-            if ink_drop:
-                ink_drop.update(dt)
+            if ink_drop is None:
+                i += 1
+                continue
                 
-                # Remove expired ink drops
-                if ink_drop.is_expired():
-                    print(f"[INK] Ink drop expired (worth {ink_drop.ink_value} ink)")
-                    entity.active = False
+            ink_drop.update(dt)
+            
+            # Remove expired ink drops
+            if ink_drop.is_expired():
+                print(f"[INK] Ink drop expired (worth {ink_drop.ink_value} ink)")
+                entity.active = False
+                super().remove_entity(entity)  # Moves the last entity into slot i
+                self._release_ink_drop(entity)
+            else:
+                i += 1
+    
+    def acquire_ink_drop(self, x, y, ink_value, lifetime=INK_DROP_LIFETIME):
+        """Spawn an ink drop at (x, y), reusing a pooled entity when available"""
+        if self._drop_pool:
+            ink_drop = self._drop_pool.pop()
+            
+            # Reset pooled components in place
+            transform = ink_drop.get_component(Transform)
+            transform.position.update(x, y)
+            transform.velocity.update(0, 0)
+            physics = ink_drop.get_component(Physics)
+            physics.velocity.update(0, 0)
+            physics.acceleration.update(0, 0)
+            physics.forces.update(0, 0)
+            physics.on_ground = False
+            physics.can_jump = True
+            ink_drop.get_component(InkDropComponent).reset(ink_value, lifetime)
+            
+            ink_drop.active = True
+            if ink_drop not in self.scene.entities:
+                self.scene.entities.append(ink_drop)
+        else:
+            ink_drop = self.scene.create_entity()
+            
+            # Add transform at spawn position
+            ink_drop.add_component(Transform(x, y))
+            
+            # Add physics for bouncing effect
+            ink_drop.add_component(Physics(mass=0.5, friction=0.7, gravity_scale=0.5))
+            
+            # Add solid collision so it doesn't fall through ground
+            ink_drop.add_component(Collision(
+                width=12, height=12, 
+                collision_type=CollisionType.SOLID
+            ))
+            
+            # Add purple renderer
+            ink_drop.add_component(Renderer(
+                color=COLORS['ink_drop'],
+                size=(12, 12),
+                shape=RenderShape.CIRCLE
+            ))
+            
+            ink_drop.add_component(InkDropComponent(ink_value=ink_value, lifetime=lifetime))
+        
+        # Add to appropriate systems
+        self.scene.physics_system.add_entity(ink_drop)
+        self.scene.collision_system.add_entity(ink_drop)
+        self.scene.render_system.add_entity(ink_drop)
+        self.add_entity(ink_drop)
+        
+        return ink_drop
+    
+    def _release_ink_drop(self, entity):
+        """Return a regular ink drop entity to the pool"""
+        ink_drop = entity.get_component(InkDropComponent)
+        if ink_drop and not ink_drop.is_player_death_drop:
+            self._drop_pool.append(entity)
     
     def _check_player_death(self):
         """Check if player has died and handle death mechanics"""
@@ -54,11 +133,6 @@ class InkSystem(System):
             return
             
         # Get player components
-        from src.components.transform import Transform
-        from src.components.health import Health
-        from src.components.stamina import Stamina
-        from src.components.physics import Physics
-        
         player_transform = player.get_component(Transform)
         player_health = player.get_component(Health)
         player_stamina = player.get_component(Stamina)
@@ -82,18 +156,23 @@ class InkSystem(System):
     
     def _create_bloodstain(self, death_position, ink_amount):
         """Create bloodstain at death location"""
-        # Remove existing bloodstain if it exists
-        if self.scene.current_bloodstain:
-            print(f"[DEATH] Removing previous bloodstain")
-            self.scene.current_bloodstain.active = False
-            self.scene.current_bloodstain = None
+        # Move an uncollected bloodstain instead of destroying and recreating it
+        bloodstain = self.scene.current_bloodstain
+        if bloodstain:
+            print(f"[DEATH] Replacing previous bloodstain")
+            transform = bloodstain.get_component(Transform)
+            transform.position.update(death_position)
+            bloodstain.get_component(InkDropComponent).reset(ink_amount, BLOODSTAIN_LIFETIME)
+            
+            # Static terrain grid is indexed by position, so re-insert at the new spot.
+            # The insert bumps the grid version, dropping ground rects cached on the old spot
+            collision = bloodstain.get_component(Collision)
+            self.scene.collision_system.static_grid.insert(bloodstain, collision.get_bounds(transform.position))
+            
+            print(f"[DEATH] Created bloodstain worth {ink_amount} ink at ({death_position.x:.1f}, {death_position.y:.1f})")
+            return
         
         # Create new bloodstain entity
-        from src.components.transform import Transform
-        from src.components.collision import Collision, CollisionType
-        from src.components.renderer import Renderer, RenderShape
-        from src.core.settings import COLORS
-        
         bloodstain = self.scene.create_entity()
         
         # Add transform at death position
@@ -115,7 +194,7 @@ class InkSystem(System):
         # Add ink drop component marked as player death drop (no lifetime expiration)
         bloodstain_component = InkDropComponent(
             ink_value=ink_amount,
-            lifetime=999999.0  # Effectively infinite - only removed by collection or replacement
+            lifetime=BLOODSTAIN_LIFETIME
         )
         bloodstain_component.is_player_death_drop = True
         bloodstain.add_component(bloodstain_component)
@@ -132,11 +211,9 @@ class InkSystem(System):
     
     def _respawn_player(self, player, transform, health, stamina, physics, ink_currency):
         """Respawn player at spawn point with reset stats"""
-        import pygame
-        
         # Reset position to spawn point
         spawn_x, spawn_y = 640, 600
-        transform.position = pygame.Vector2(spawn_x, spawn_y)
+        transform.position.update(spawn_x, spawn_y)
         
         # Reset health to full
         health.current_health = health.max_health
@@ -151,9 +228,9 @@ class InkSystem(System):
         
         # Reset physics state
         if physics:
-            physics.velocity = pygame.Vector2(0, 0)
-            physics.acceleration = pygame.Vector2(0, 0)
-            physics.forces = pygame.Vector2(0, 0)
+            physics.velocity.update(0, 0)
+            physics.acceleration.update(0, 0)
+            physics.forces.update(0, 0)
             physics.on_ground = True  # Assume spawning on ground
         
         # Ensure player entity is active and visible
@@ -163,6 +240,12 @@ class InkSystem(System):
         
         print(f"[DEATH] Player respawned at spawn point ({spawn_x}, {spawn_y}) with full health and stamina")
             
+    def remove_entity(self, entity):
+        """Remove entity and pool it if it was a tracked ink drop"""
+        if self.has_entity(entity):
+            super().remove_entity(entity)
+            self._release_ink_drop(entity)
+            
     def add_entity(self, entity):
         """Add entity to ink system if it has ink-related components"""
         if (entity.has_component(InkDropComponent) or 
@@ -16,68 +16,67 @@ class MovementSystem(System):
     def __init__(self, input_manager):
         super().__init__()
         self.input_manager = input_manager
+        self._controlled = None  # Bound components of the player entity
         
     def update(self, dt: float):
-        """Update movement for all entities"""
-        for entity in self.entities:
-            transform = entity.get_component(Transform)
-            physics = entity.get_component(Physics)
-            stamina = entity.get_component(Stamina)
-            
-            if not transform or not physics:
-                continue
-            
-            # Get input
-            movement = self.input_manager.get_movement_vector()
-            jump_pressed = self.input_manager.is_jump_pressed()
-            dash_pressed = self.input_manager.is_dash_pressed()
+        """Update movement for the input-controlled entity"""
+        if self._controlled is None:
+            return
             
-            # Handle horizontal movement - full control on ground, limited in air
-            if movement.x != 0:
-                horizontal_force = movement.x * PLAYER_SPEED
-                if physics.on_ground:
-                    physics.velocity.x = horizontal_force  # Direct control on ground
-                else:
-                    # Limited air control - can adjust trajectory slightly
-                    air_control_strength = 0.5  # Half the normal control
-                    target_velocity = horizontal_force * air_control_strength
-                    # Blend towards target velocity instead of setting it directly
-                    physics.velocity.x = pygame.math.lerp(physics.velocity.x, target_velocity, 0.1)
+        # Get input once per frame
+        movement = self.input_manager.get_movement_vector()
+        jump_pressed = self.input_manager.is_jump_pressed()
+        dash_pressed = self.input_manager.is_dash_pressed()
+        
+        entity, transform, physics, stamina = self._controlled
+        
+        # Handle horizontal movement - full control on ground, limited in air
+        if movement.x != 0:
+            horizontal_force = movement.x * PLAYER_SPEED
+            if physics.on_ground:
+                physics.velocity.x = horizontal_force  # Direct control on ground
             else:
-                # No input - apply friction to stop movement
-                if physics.on_ground:
-                    physics.velocity.x *= 0.7  # Strong ground friction when no input
-            
-            # Handle jumping
-            if jump_pressed and physics.on_ground and physics.can_jump:
-                if not stamina or stamina.can_perform_action('jump'):
-                    physics.velocity.y = -PLAYER_JUMP_POWER
-                    physics.on_ground = False
-                    physics.can_jump = False
+                # Limited air control - can adjust trajectory slightly
+                air_control_strength = 0.5  # Half the normal control
+                target_velocity = horizontal_force * air_control_strength
+                # Blend towards target velocity instead of setting it directly
+                vx = physics.velocity.x
+                physics.velocity.x = vx + (target_velocity - vx) * 0.1
+        else:
+            # No input - apply friction to stop movement
+            if physics.on_ground:
+                physics.velocity.x *= 0.7  # Strong ground friction when no input
+        
+        # Handle jumping
+        if jump_pressed and physics.on_ground and physics.can_jump:
+            if not stamina or stamina.can_perform_action('jump'):
+                physics.velocity.y = -PLAYER_JUMP_POWER
+                physics.on_ground = False
+                physics.can_jump = False
+                
+                if stamina:
+                    stamina.consume_stamina('jump')
+        
+        # Handle dashing
+        if dash_pressed:
+            if entity.dash_cooldown <= 0:
+                if not stamina or stamina.can_perform_action('dash'):
+                    self._perform_dash(entity, movement)
                     
                     if stamina:
-                        stamina.consume_stamina('jump')
-            
-            # Handle dashing
-            if dash_pressed and hasattr(entity, 'dash_cooldown'):
-                if entity.dash_cooldown <= 0:
-                    if not stamina or stamina.can_perform_action('dash'):
-                        self._perform_dash(entity, movement)
-                        
-                        if stamina:
-                            stamina.consume_stamina('dash')
-            
-            # Update dash cooldown and state
-            if hasattr(entity, 'dash_cooldown') and entity.dash_cooldown > 0:
-                entity.dash_cooldown -= dt
-                
-                # End dash when cooldown expires
-                if entity.dash_cooldown <= 0 and hasattr(entity, 'dashing'):
-                    entity.dashing = False
+                        stamina.consume_stamina('dash')
+        
+        # Update dash cooldown and state
+        if entity.dash_cooldown > 0:
+            entity.dash_cooldown -= dt
             
-            # Reset ground state (will be set by collision system)
-            if physics.velocity.y > 0:  # Falling
-                physics.on_ground = False
+            # End dash when cooldown expires
+            if entity.dash_cooldown <= 0:
+                entity.dashing = False
+        
+        # Reset ground state (will be set by collision system)
+        if physics.velocity.y > 0:  # Falling
+            physics.on_ground = False
     
     def _perform_dash(self, entity, direction):
         """Perform dash ability"""
@@ -93,8 +92,7 @@ class MovementSystem(System):
         dash_direction.normalize_ip()
         
         # Apply dash velocity
-        dash_velocity = dash_direction * PLAYER_DASH_SPEED
-        physics.velocity = dash_velocity
+        physics.velocity.update(dash_direction.x * PLAYER_DASH_SPEED, dash_direction.y * PLAYER_DASH_SPEED)
         
         # Set dash cooldown
         entity.dash_cooldown = PLAYER_DASH_DURATION
@@ -117,4 +115,20 @@ class MovementSystem(System):
             
             # Initialize dash properties
             entity.dash_cooldown = 0.0
-            entity.dashing = False
\ No newline at end of file
+            entity.dashing = False
+            
+            if self._controlled is None:
+                self._controlled = self._bound[id(entity)]
+    
+    def remove_entity(self, entity):
+        """Remove entity and hand control to the next player entity, if any"""
+        super().remove_entity(entity)
+        if self._controlled is not None and self._controlled[0] is entity:
+            self._controlled = next(iter(self._bound.values()), None)
+    
+    def _bind(self, entity):
+        """Cache Transform, Physics and Stamina for the update loop"""
+        return (entity,
+                entity.get_component(Transform),
+                entity.get_component(Physics),
+                entity.get_component(Stamina))
\ No newline at end of file
@@ -6,7 +6,9 @@ from src.systems.system import System
 from src.components.transform import Transform
 from src.components.physics import Physics
 from src.components.collision import Collision
-from src.core.settings import GRAVITY, TERMINAL_VELOCITY
+from src.components.stamina import Stamina
+from src.components.enemy_type import EnemyType
+from src.core.settings import GRAVITY, TERMINAL_VELOCITY, DEBUG_PHYSICS_LOGGING
 
 
 class PhysicsSystem(System):
@@ -17,6 +19,7 @@ class PhysicsSystem(System):
         self.gravity = pygame.Vector2(0, GRAVITY)
         self.terminal_velocity = TERMINAL_VELOCITY
         self.collision_system = collision_system
+        self.debug = DEBUG_PHYSICS_LOGGING  # Log ground state transitions
         
     def set_collision_system(self, collision_system):
         """Set reference to collision system for ground detection"""
@@ -24,32 +27,38 @@ class PhysicsSystem(System):
         
     def update(self, dt: float):
         """Update physics for all entities"""
-        for entity in self.entities:
-            transform = entity.get_component(Transform)
-            physics = entity.get_component(Physics)
-            
-            if not transform or not physics:
-                continue
-            
+        gravity_y = self.gravity.y
+        terminal_velocity = self.terminal_velocity
+        debug = __debug__ and self.debug
+        
+        for entity, transform, physics, collision in self._bound.values():
             # Skip physics for projectiles - they maintain constant velocity
-            if hasattr(entity, 'projectile_data'):
-                transform.position += physics.velocity * dt
+            if entity.projectile_data is not None:
+                position = transform.position
+                position.x += physics.velocity.x * dt
+                position.y += physics.velocity.y * dt
                 continue
                 
+            # Fused gravity + force + velocity integration on scalars
+            acceleration = physics.acceleration
+            forces = physics.forces
+            ax = acceleration.x
+            ay = acceleration.y
+            
             # Apply gravity
             if physics.affected_by_gravity:
-                physics.acceleration.y += self.gravity.y * physics.gravity_scale
+                ay += gravity_y * physics.gravity_scale
             
             # Apply forces
-            if physics.forces.length() > 0:
-                physics.acceleration += physics.forces / physics.mass
-            
-            # Update velocity from acceleration
-            physics.velocity += physics.acceleration * dt
+            if forces.x or forces.y:
+                inv_mass = 1.0 / physics.mass
+                ax += forces.x * inv_mass
+                ay += forces.y * inv_mass
             
-            # Terminal velocity check
-            if physics.velocity.y > self.terminal_velocity:
-                physics.velocity.y = self.terminal_velocity
+            # Update velocity from acceleration, capped at terminal velocity
+            velocity = physics.velocity
+            velocity.x += ax * dt
+            velocity.y = min(velocity.y + ay * dt, terminal_velocity)
             
             # Apply friction
             physics.apply_friction()
@@ -57,56 +66,57 @@ class PhysicsSystem(System):
             # Limit velocity
             physics.limit_velocity()
             
-            # Debug entity info
-            entity_info = ""
-            if hasattr(entity, 'get_component'):
-                from src.components.stamina import Stamina
-                from src.components.enemy_type import EnemyType
-                if entity.get_component(Stamina):
-                    entity_info = "PLAYER"
-                elif entity.get_component(EnemyType):
-                    entity_type = entity.get_component(EnemyType)
-                    entity_info = f"ENEMY_{entity_type.enemy_type.value.upper()}"
-                else:
-                    entity_info = "TERRAIN"
-            
             # Check if entity is still above ground (crucial fix!)
             if physics.on_ground:
-                if not self._is_above_ground(entity):
-                    print(f"[PHYSICS] {entity_info} walked off edge - setting on_ground=False")
+                if not self._is_above_ground(entity, transform, collision, physics):
+                    if debug:
+                        print(f"[PHYSICS] {self._describe_entity(entity)} walked off edge - setting on_ground=False")
                     physics.on_ground = False
             
-            # Update position with collision awareness
-            if physics.on_ground and physics.velocity.y > 0:
-                # If on ground and trying to move down, prevent it (this is normal behavior)
-                physics.velocity.y = 0
-            
-            # Reset ground state if moving upward (jumping)
-            if physics.velocity.y < -10:  # Significant upward movement
-                if physics.on_ground:
-                    print(f"[PHYSICS] {entity_info} jumping/flying - setting on_ground=False (y_vel={physics.velocity.y:.1f})")
-                physics.on_ground = False
-                
-            # Keep ground state if moving very slowly downward (prevents fall-through)
-            if physics.on_ground and physics.velocity.y < 50:
-                physics.velocity.y = max(physics.velocity.y, 0)
+            # Grounded entities either leave the ground (significant upward movement,
+            # i.e. jumping) or have vertical velocity pinned to zero (prevents fall-through)
+            if physics.on_ground:
+                if velocity.y < -10:
+                    if debug:
+                        print(f"[PHYSICS] {self._describe_entity(entity)} jumping/flying - setting on_ground=False (y_vel={velocity.y:.1f})")
+                    physics.on_ground = False
+                else:
+                    velocity.y = 0
             
-            # Update position
-            transform.position += physics.velocity * dt
+            # Update position (in place, no Vector2 temporaries)
+            position = transform.position
+            position.x += velocity.x * dt
+            position.y += velocity.y * dt
             
             # Update transform velocity for other systems
-            transform.velocity = physics.velocity.copy()
+            transform.velocity.update(velocity)
             
             # Reset acceleration and forces for next frame
-            physics.acceleration = pygame.Vector2(0, 0)
+            acceleration.update(0, 0)
             physics.reset_forces()
     
+    def _describe_entity(self, entity):
+        """Get a short entity label for debug logging"""
+        if entity.get_component(Stamina):
+            return "PLAYER"
+        entity_type = entity.get_component(EnemyType)
+        if entity_type:
+            return f"ENEMY_{entity_type.enemy_type.value.upper()}"
+        return "TERRAIN"
+    
     def add_entity(self, entity):
         """Add entity if it has required components"""
         if (entity.has_component(Transform) and 
             entity.has_component(Physics)):
             super().add_entity(entity)
     
+    def _bind(self, entity):
+        """Cache Transform, Physics and (optional) Collision for the update loop"""
+        return (entity,
+                entity.get_component(Transform),
+                entity.get_component(Physics),
+                entity.get_component(Collision))
+    
     def apply_impulse_to_entity(self, entity, impulse):
         """Apply an impulse to a specific entity"""
         physics = entity.get_component(Physics)
@@ -119,45 +129,51 @@ class PhysicsSystem(System):
         if physics:
             physics.velocity = velocity.copy()
     
-    def _is_above_ground(self, entity):
+    def _is_above_ground(self, entity, transform, collision, physics):
         """Check if entity is above solid ground using collision detection"""
         if not self.collision_system:
             return True  # Assume above ground if no collision system
             
-        transform = entity.get_component(Transform)
-        collision = entity.get_component(Collision)
-        
-        if not transform or not collision:
+        if not collision:
+            return True
+            
+        # Terrain was added, moved or removed since the last probe - the cached rect may be gone
+        static_grid = self.collision_system.static_grid
+        if physics.ground_grid_version != static_grid.version:
+            physics.ground_bounds = None
+            
+        # Entity hasn't moved since ground was last confirmed and terrain is unchanged
+        position = transform.position
+        probe_position = (position.x, position.y)
+        if physics.ground_bounds is not None and physics.ground_probe_position == probe_position:
             return True
             
         # Create a test position slightly below the entity
-        test_position = transform.position.copy()
+        test_position = position.copy()
         test_position.y += collision.height // 2 + 5  # Just below entity's feet
+        entity_bounds = collision.get_bounds(test_position)
+        
+        # Still over the terrain found last time - no need to search the grid
+        if physics.ground_bounds is not None and entity_bounds.colliderect(physics.ground_bounds):
+            physics.ground_probe_position = probe_position
+            return True
         
-        # Check if there would be a collision with solid ground at this position
-        for other_entity in self.collision_system.entities:
+        # Only probe static terrain in the grid cells under the entity's feet
+        physics.ground_bounds = None
+        for other_entity in static_grid.query(entity_bounds):
             if other_entity == entity:
                 continue
                 
             other_collision = other_entity.get_component(Collision)
             other_transform = other_entity.get_component(Transform)
             
-            if not other_collision or not other_transform:
-                continue
-                
-            # Only check collision with solid terrain (not other moving entities)
-            if other_collision.collision_type.value != "solid":
-                continue
-                
-            # Skip if this is another moving entity (has physics)
-            if other_entity.get_component(Physics):
-                continue
-                
             # Check if test position would overlap with this solid terrain
-            entity_bounds = collision.get_bounds(test_position)
             other_bounds = other_collision.get_bounds(other_transform.position)
             
             if entity_bounds.colliderect(other_bounds):
+                physics.ground_bounds = other_bounds
+                physics.ground_probe_position = probe_position
+                physics.ground_grid_version = static_grid.version
                 return True  # Found solid ground below
                 
         return False  # No solid ground detected below
\ No newline at end of file
@@ -3,10 +3,23 @@ Rendering system for drawing entities
 """
 import pygame
 import math
+from array import array
+from bisect import bisect_left
 from src.systems.system import System
 from src.components.transform import Transform
 from src.components.renderer import Renderer, RenderShape
 from src.components.health import Health
+from src.components.physics import Physics
+
+# Dash flash alpha over one sine period, sampled once at import
+FLASH_SPEED = 8.0  # Flashes per second
+_FLASH_LUT_SIZE = 256  # Power of two so the index wraps with a mask
+_FLASH_LUT = array('B', [int(128 + 127 * math.sin(i * 2 * math.pi / _FLASH_LUT_SIZE)) for i in range(_FLASH_LUT_SIZE)])
+_FLASH_LUT_SCALE = FLASH_SPEED * 0.01 * _FLASH_LUT_SIZE / (2 * math.pi)  # ticks -> LUT index
+
+# Translucent alpha is quantized to steps of 8 so each renderer caches at most 32 surfaces per color
+_ALPHA_BUCKET_MASK = 0xF8
+_SURFACE_CACHE_LIMIT = 64  # Per-renderer cap; flashing colors would otherwise grow the cache unbounded
 
 
 class RenderSystem(System):
@@ -16,6 +29,17 @@ class RenderSystem(System):
         super().__init__()
         self.screen = None
         self.camera_offset = pygame.Vector2(0, 0)
+        self._frame_ticks = 0  # pygame ticks sampled at the start of render()
+        self._blit_batch = []  # (surface, dest) pairs submitted in one screen.blits() call
+        
+        # Bound tuples kept sorted by (layer, insertion order); _render_keys mirrors the order
+        self._sorted_entities = []
+        self._sorted_keys = []
+        self._render_keys = {}  # id(entity) -> (layer, insertion order)
+        self._insert_count = 0
+        
+        # Indexed by RenderShape value
+        self._shape_dispatch = (self._render_rectangle, self._render_circle, self._render_triangle)
         
     def set_screen(self, screen):
         """Set the screen surface for rendering"""
@@ -27,10 +51,8 @@ class RenderSystem(System):
         
     def update(self, dt: float):
         """Update animations and prepare for rendering"""
-        for entity in self.entities:
-            renderer = entity.get_component(Renderer)
-            if renderer:
-                renderer.update_animation(dt)
+        for _, _, renderer, _, _ in self._bound.values():
+            renderer.update_animation(dt)
     
     def render(self, screen=None):
         """Render all entities to screen"""
@@ -40,30 +62,39 @@ class RenderSystem(System):
         if not self.screen:
             return
             
-        # Sort entities by layer for depth ordering
-        sorted_entities = sorted(
-            self.entities, 
-            key=lambda e: e.get_component(Renderer).layer if e.get_component(Renderer) else 0
-        )
+        screen_width, screen_height = self.screen.get_size()
         
-        for entity in sorted_entities:
-            transform = entity.get_component(Transform)
-            renderer = entity.get_component(Renderer)
-            health = entity.get_component(Health)
-            
-            if not transform or not renderer or not renderer.visible:
+        # Sample the clock once per frame; all flashing entities share one alpha
+        self._frame_ticks = pygame.time.get_ticks()
+        flash_alpha = _FLASH_LUT[int(self._frame_ticks * _FLASH_LUT_SCALE) & (_FLASH_LUT_SIZE - 1)]
+        
+        blit_batch = self._blit_batch
+        blit_batch.clear()
+        shape_dispatch = self._shape_dispatch
+        camera_x, camera_y = self.camera_offset
+        
+        # Already in layer order (maintained on add/remove/set_layer)
+        for entity, transform, renderer, health, physics in self._sorted_entities:
+            if not renderer.visible:
                 continue
                 
-            # Convert world position to screen position
-            screen_pos = self._world_to_screen(transform.position)
+            # Convert world position to screen position on scalars (no Vector2 per entity)
+            position = transform.position
+            screen_x = position.x - camera_x
+            screen_y = position.y - camera_y
+            
+            # Skip entities entirely outside the screen
+            half_width = renderer.size[0] / 2
+            half_height = renderer.size[1] / 2
+            if (screen_x + half_width < 0 or screen_x - half_width > screen_width or
+                screen_y + half_height < 0 or screen_y - half_height > screen_height):
+                continue
             
             # Apply visual effects for special states
             original_alpha = renderer.alpha
             original_color = renderer.color
             
             # Debug: Show physics state with color changes
-            from src.components.physics import Physics
-            physics = entity.get_component(Physics)
             if physics:
                 if physics.on_ground:
                     # Add green tint for entities on ground
@@ -74,90 +105,135 @@ class RenderSystem(System):
                     r, g, b = original_color
                     renderer.color = (min(255, r + 50), min(255, g), min(255, b))
             
-            if health and health.invincible and hasattr(entity, 'dashing') and entity.dashing:
+            if health and health.invincible and entity.dashing:
                 # Flash effect during dash invincibility
-                flash_speed = 8.0  # Flashes per second
-                renderer.alpha = int(128 + 127 * math.sin(pygame.time.get_ticks() * flash_speed * 0.01))
+                renderer.alpha = flash_alpha
             
             # Render based on shape type
-            if renderer.shape == RenderShape.RECTANGLE:
-                self._render_rectangle(screen_pos, renderer)
-            elif renderer.shape == RenderShape.CIRCLE:
-                self._render_circle(screen_pos, renderer)
-            elif renderer.shape == RenderShape.TRIANGLE:
-                self._render_triangle(screen_pos, renderer)
+            shape_dispatch[renderer.shape](screen_x, screen_y, renderer)
             
             # Restore original values
             renderer.alpha = original_alpha
             renderer.color = original_color
+            
+        # Submit every pre-rendered shape at once; list order preserves layering
+        self.screen.blits(blit_batch, doreturn=False)
     
     def _world_to_screen(self, world_pos):
         """Convert world position to screen position"""
         return world_pos - self.camera_offset
     
-    def _render_rectangle(self, screen_pos, renderer):
-        """Render a rectangle"""
-        rect = pygame.Rect(
-            screen_pos.x - renderer.size[0] // 2,
-            screen_pos.y - renderer.size[1] // 2,
-            renderer.size[0],
-            renderer.size[1]
-        )
-        
-        # Apply alpha if needed
-        if renderer.alpha < 255:
-            # Create a temporary surface for alpha blending
-            temp_surface = pygame.Surface(renderer.size, pygame.SRCALPHA)
-            temp_surface.fill((*renderer.color, renderer.alpha))
-            self.screen.blit(temp_surface, rect.topleft)
-        else:
-            pygame.draw.rect(self.screen, renderer.color, rect)
+    def _render_rectangle(self, screen_x, screen_y, renderer):
+        """Queue a rectangle"""
+        self._blit_batch.append((
+            self._get_shape_surface(renderer),
+            (screen_x - renderer.size[0] // 2, screen_y - renderer.size[1] // 2)
+        ))
     
-    def _render_circle(self, screen_pos, renderer):
-        """Render a circle"""
+    def _render_circle(self, screen_x, screen_y, renderer):
+        """Queue a circle"""
         radius = renderer.size[0] // 2
-        
-        # Apply alpha if needed
-        if renderer.alpha < 255:
-            temp_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surface, (*renderer.color, renderer.alpha), (radius, radius), radius)
-            self.screen.blit(temp_surface, (screen_pos.x - radius, screen_pos.y - radius))
-        else:
-            pygame.draw.circle(self.screen, renderer.color, (int(screen_pos.x), int(screen_pos.y)), radius)
+        self._blit_batch.append((
+            self._get_shape_surface(renderer),
+            (screen_x - radius, screen_y - radius)
+        ))
+    
+    def _render_triangle(self, screen_x, screen_y, renderer):
+        """Queue a triangle (pointing up)"""
+        self._blit_batch.append((
+            self._get_shape_surface(renderer),
+            (screen_x - renderer.size[0] // 2, screen_y - renderer.size[1] // 2)
+        ))
     
-    def _render_triangle(self, screen_pos, renderer):
-        """Render a triangle"""
-        # Calculate triangle points
+    def _get_shape_surface(self, renderer):
+        """Get a cached pre-rendered surface for the renderer's shape, size, color and alpha"""
+        alpha = renderer.alpha
+        if alpha < 255:
+            alpha &= _ALPHA_BUCKET_MASK
+        key = (renderer.shape, renderer.size, renderer.color, alpha)
+        cache = renderer._surface_cache
+        surface = cache.get(key)
+        if surface is not None:
+            return surface
+            
         width, height = renderer.size
-        half_width = width // 2
-        half_height = height // 2
-        
-        # Triangle pointing up
-        points = [
-            (screen_pos.x, screen_pos.y - half_height),  # Top
-            (screen_pos.x - half_width, screen_pos.y + half_height),  # Bottom left
-            (screen_pos.x + half_width, screen_pos.y + half_height),  # Bottom right
-        ]
-        
-        # Apply alpha if needed
-        if renderer.alpha < 255:
-            temp_surface = pygame.Surface(renderer.size, pygame.SRCALPHA)
-            # Adjust points for temp surface
-            temp_points = [
-                (half_width, 0),
-                (0, height),
-                (width, height)
-            ]
-            pygame.draw.polygon(temp_surface, (*renderer.color, renderer.alpha), temp_points)
-            self.screen.blit(temp_surface, (screen_pos.x - half_width, screen_pos.y - half_height))
+        has_display = pygame.display.get_surface() is not None
+        if renderer.shape == RenderShape.RECTANGLE and alpha == 255:
+            # Opaque rectangles need no per-pixel alpha, which keeps their blits plain copies
+            surface = pygame.Surface(renderer.size)
+            surface.fill(renderer.color)
+            if has_display:
+                surface = surface.convert()
         else:
-            pygame.draw.polygon(self.screen, renderer.color, points)
+            rgba = (*renderer.color, alpha)
+            if renderer.shape == RenderShape.CIRCLE:
+                radius = width // 2
+                surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(surface, rgba, (radius, radius), radius)
+            elif renderer.shape == RenderShape.TRIANGLE:
+                surface = pygame.Surface(renderer.size, pygame.SRCALPHA)
+                pygame.draw.polygon(surface, rgba, [(width // 2, 0), (0, height), (width, height)])
+            else:
+                surface = pygame.Surface(renderer.size, pygame.SRCALPHA)
+                surface.fill(rgba)
+                
+            # Match the display format for faster blits when a display exists
+            if has_display:
+                surface = surface.convert_alpha()
+            
+        if len(cache) >= _SURFACE_CACHE_LIMIT:
+            cache.clear()
+        cache[key] = surface
+        return surface
     
     def add_entity(self, entity):
         """Add entity if it has required components"""
         if (entity.has_component(Transform) and 
             entity.has_component(Renderer)):
             super().add_entity(entity)
+            if id(entity) not in self._render_keys:
+                self._insert_sorted(entity)
+    
+    def remove_entity(self, entity):
+        """Remove entity from the system and the layer-sorted render list"""
+        super().remove_entity(entity)
+        if id(entity) in self._render_keys:
+            self._remove_sorted(entity)
+    
+    def set_layer(self, entity, new_layer):
+        """Change an entity's render layer and move it to its new depth position"""
+        renderer = entity.get_component(Renderer)
+        if not renderer:
+            return
+        tracked = id(entity) in self._render_keys
+        if tracked:
+            self._remove_sorted(entity)
+        renderer.layer = new_layer
+        if tracked:
+            self._insert_sorted(entity)
+    
+    def _insert_sorted(self, entity):
+        """Insert an entity's bound tuple at its layer position (ties keep insertion order)"""
+        key = (self._bound[id(entity)][2].layer, self._insert_count)
+        self._insert_count += 1
+        index = bisect_left(self._sorted_keys, key)
+        self._sorted_keys.insert(index, key)
+        self._sorted_entities.insert(index, self._bound[id(entity)])
+        self._render_keys[id(entity)] = key
+    
+    def _remove_sorted(self, entity):
+        """Remove an entity from the layer-sorted render list"""
+        index = bisect_left(self._sorted_keys, self._render_keys.pop(id(entity)))
+        del self._sorted_keys[index]
+        del self._sorted_entities[index]
+    
+    def _bind(self, entity):
+        """Cache the components read while rendering (Health and Physics are optional)"""
+        return (entity,
+                entity.get_component(Transform),
+                entity.get_component(Renderer),
+                entity.get_component(Health),
+                entity.get_component(Physics))
     
     def get_screen_bounds(self):
         """Get screen bounds for culling"""
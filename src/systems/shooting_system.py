@@ -16,7 +16,7 @@ from src.core.settings import PROJECTILE_SPEED, PROJECTILE_LIFETIME, COLORS
 class ProjectileComponent:
     """Component for projectile-specific data"""
     def __init__(self, lifetime=PROJECTILE_LIFETIME, damage=10, owner=None):
-        self.lifetime = lifetime
+        self.lifetime = lifetime  # Spawn lifetime; ShootingSystem tracks expiry on its clock
         self.max_lifetime = lifetime
         self.damage = damage
         self.owner = owner  # Entity that fired this projectile
@@ -30,7 +30,12 @@ class ShootingSystem(System):
         self.input_manager = input_manager
         self.scene = scene
         self.projectiles = []
+        self._projectile_index = {}  # id(projectile) -> position in self.projectiles
+        self._expiry_times = []  # Column aligned with self.projectiles: clock time each one expires
+        self._clock = 0.0  # Seconds of projectile simulation time elapsed
+        self._pending_remove = []  # Expired projectiles removed together at the end of the update
         self.shoot_cooldown = 0.0  # Cooldown timer for player shooting
+        self._projectile_pool = []  # Expired/spent projectile entities ready for reuse
         
     def update(self, dt: float):
         """Update shooting system"""
@@ -38,10 +43,9 @@ class ShootingSystem(System):
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= dt
         
-        # Handle player shooting
+        # Handle player shooting (only shooters are ever added to self.entities)
         for entity in self.entities:
-            if hasattr(entity, 'can_shoot') and entity.can_shoot:
-                self._handle_player_shooting(entity, dt)
+            self._handle_player_shooting(entity, dt)
         
         # Update projectiles
         self._update_projectiles(dt)
@@ -78,39 +82,72 @@ class ShootingSystem(System):
         if not owner_transform:
             return
             
-        # Create projectile entity
-        projectile = self.scene.create_entity()
-        
-        # Position projectile at owner's position
-        projectile_pos = owner_transform.position.copy()
-        projectile.add_component(Transform(projectile_pos.x, projectile_pos.y))
-        
-        # Add physics with velocity in aim direction
-        physics = Physics(mass=0.1, friction=1.0, gravity_scale=0)  # No gravity for projectiles
-        physics.velocity = direction * PROJECTILE_SPEED
-        physics.affected_by_gravity = False  # Projectiles don't fall
-        physics.max_speed = PROJECTILE_SPEED + 100  # Allow fast projectiles
-        projectile.add_component(physics)
-        
-        # Add collision (visible size)
-        projectile.add_component(Collision(
-            width=8, height=8,
-            collision_type=CollisionType.DAMAGE
-        ))
-        
-        # Add renderer (make projectiles more visible)
-        projectile.add_component(Renderer(
-            color=COLORS['projectile'],
-            size=(8, 8),
-            shape=RenderShape.CIRCLE
-        ))
-        
-        # Add projectile-specific component
-        projectile.projectile_data = ProjectileComponent(
-            lifetime=PROJECTILE_LIFETIME,
-            damage=10,
-            owner=owner
+        # Fire from the owner's position in the aim direction (scalar velocity, no Vector2 temporaries)
+        self.acquire_projectile(
+            owner,
+            owner_transform.position.x, owner_transform.position.y,
+            direction.x * PROJECTILE_SPEED, direction.y * PROJECTILE_SPEED
         )
+    
+    def acquire_projectile(self, owner, x, y, velocity_x, velocity_y, size=8,
+                           color=COLORS['projectile'], damage=10,
+                           lifetime=PROJECTILE_LIFETIME, max_speed=PROJECTILE_SPEED + 100):
+        """Spawn a projectile at (x, y), reusing a pooled entity when available"""
+        if self._projectile_pool:
+            projectile = self._projectile_pool.pop()
+            
+            # Reset pooled components in place
+            projectile.get_component(Transform).position.update(x, y)
+            physics = projectile.get_component(Physics)
+            physics.velocity.update(velocity_x, velocity_y)
+            physics.acceleration.update(0, 0)
+            physics.forces.update(0, 0)
+            physics.max_speed = max_speed
+            collision = projectile.get_component(Collision)
+            collision.width = collision.height = size
+            renderer = projectile.get_component(Renderer)
+            renderer.color = color
+            renderer.size = (size, size)
+            projectile_data = projectile.projectile_data
+            projectile_data.lifetime = projectile_data.max_lifetime = lifetime
+            projectile_data.damage = damage
+            projectile_data.owner = owner
+            
+            # Pooled projectiles have always left the scene, so no membership scan is needed
+            projectile.active = True
+            self.scene.entities.append(projectile)
+        else:
+            projectile = self.scene.create_entity()
+            
+            # Position projectile at the spawn point
+            projectile.add_component(Transform(x, y))
+            
+            # Add physics with velocity in aim direction
+            physics = Physics(mass=0.1, friction=1.0, gravity_scale=0)  # No gravity for projectiles
+            physics.velocity.update(velocity_x, velocity_y)
+            physics.affected_by_gravity = False  # Projectiles don't fall
+            physics.max_speed = max_speed  # Allow fast projectiles
+            projectile.add_component(physics)
+            
+            # Add collision (visible size)
+            projectile.add_component(Collision(
+                width=size, height=size,
+                collision_type=CollisionType.DAMAGE
+            ))
+            
+            # Add renderer (make projectiles more visible)
+            projectile.add_component(Renderer(
+                color=color,
+                size=(size, size),
+                shape=RenderShape.CIRCLE
+            ))
+            
+            # Add projectile-specific component
+            projectile.projectile_data = ProjectileComponent(
+                lifetime=lifetime,
+                damage=damage,
+                owner=owner
+            )
         
         # Add to specific systems
         self.scene.physics_system.add_entity(projectile)
@@ -118,25 +155,66 @@ class ShootingSystem(System):
         self.scene.render_system.add_entity(projectile)
         
         # Track projectile
+        self._projectile_index[id(projectile)] = len(self.projectiles)
         self.projectiles.append(projectile)
+        self._expiry_times.append(self._clock + lifetime)
+        
+        return projectile
     
     def _update_projectiles(self, dt):
         """Update projectile lifetimes"""
-        for projectile in self.projectiles[:]:  # Copy list to avoid modification during iteration
-            if hasattr(projectile, 'projectile_data'):
-                projectile.projectile_data.lifetime -= dt
-                
-                # Remove expired projectiles
-                if projectile.projectile_data.lifetime <= 0:
-                    self._remove_projectile(projectile)
+        # Advance one shared clock instead of decrementing every projectile's lifetime
+        self._clock += dt
+        now = self._clock
+        
+        # Collect expired projectiles in one pass over the expiry column, then remove them together
+        projectiles = self.projectiles
+        pending = self._pending_remove
+        for i, expiry_time in enumerate(self._expiry_times):
+            if expiry_time <= now:
+                pending.append(projectiles[i])
+        if pending:
+            self._drain_removals()
+    
+    def _drain_removals(self):
+        """Remove all pending projectiles from the scene in one batch"""
+        pending = self._pending_remove
+        
+        # Releases them to the pool via remove_entity
+        self.scene.remove_entities(pending)
+        
+        # Any already out of the scene are released directly
+        for projectile in pending:
+            if id(projectile) in self._projectile_index:
+                self._release_projectile(projectile)
+        pending.clear()
     
     def _remove_projectile(self, projectile):
         """Remove a projectile from the game"""
-        if projectile in self.projectiles:
-            self.projectiles.remove(projectile)
-        
-        # Remove from scene
+        # Remove from scene (releases it to the pool via remove_entity)
         self.scene.remove_entity(projectile)
+        
+        # Already out of the scene - release it directly
+        if id(projectile) in self._projectile_index:
+            self._release_projectile(projectile)
+    
+    def _release_projectile(self, projectile):
+        """Stop tracking a projectile (swap-remove) and return it to the pool"""
+        index = self._projectile_index.pop(id(projectile))
+        last = self.projectiles.pop()
+        last_expiry = self._expiry_times.pop()
+        if last is not projectile:
+            self.projectiles[index] = last
+            self._expiry_times[index] = last_expiry
+            self._projectile_index[id(last)] = index
+        projectile.active = False
+        self._projectile_pool.append(projectile)
+    
+    def remove_entity(self, entity):
+        """Remove entity and pool it if it was a tracked projectile"""
+        super().remove_entity(entity)
+        if id(entity) in self._projectile_index:
+            self._release_projectile(entity)
     
     def add_entity(self, entity):
         """Add entity that can shoot (player only)"""
@@ -144,12 +222,10 @@ class ShootingSystem(System):
         # (enemies use AI system for shooting)
         if entity.has_component(Stamina):  # Only players have stamina
             super().add_entity(entity)
-            # Mark entity as able to shoot
-            entity.can_shoot = True
     
     def handle_projectile_collision(self, projectile, target):
         """Handle projectile hitting a target"""
-        if not hasattr(projectile, 'projectile_data'):
+        if projectile.projectile_data is None:
             return
             
         # Don't hit the owner
@@ -2,7 +2,7 @@
 Base system class for ECS architecture
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Optional
 from src.entities.entity import Entity
 
 
@@ -11,6 +11,8 @@ class System(ABC):
     
     def __init__(self):
         self.entities: List[Entity] = []
+        self._index: Dict[int, int] = {}  # id(entity) -> position in self.entities
+        self._bound: Dict[int, tuple] = {}  # id(entity) -> cached component tuple
     
     @abstractmethod
     def update(self, dt: float):
@@ -19,10 +21,28 @@ class System(ABC):
     
     def add_entity(self, entity: Entity):
         """Add entity to system"""
-        if entity not in self.entities:
+        if id(entity) not in self._index:
+            self._index[id(entity)] = len(self.entities)
             self.entities.append(entity)
+            bound = self._bind(entity)
+            if bound is not None:
+                self._bound[id(entity)] = bound
     
     def remove_entity(self, entity: Entity):
-        """Remove entity from system"""
-        if entity in self.entities:
-            self.entities.remove(entity)
\ No newline at end of file
+        """Remove entity from system (swap-remove: the last entity takes its slot)"""
+        index = self._index.pop(id(entity), None)
+        if index is None:
+            return
+        last = self.entities.pop()
+        if last is not entity:
+            self.entities[index] = last
+            self._index[id(last)] = index
+        self._bound.pop(id(entity), None)
+    
+    def has_entity(self, entity: Entity) -> bool:
+        """Check if entity is registered with this system"""
+        return id(entity) in self._index
+    
+    def _bind(self, entity: Entity) -> Optional[tuple]:
+        """Resolve the components this system reads every frame (override in subclasses)"""
+        return None
\ No newline at end of file
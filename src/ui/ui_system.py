@@ -7,8 +7,34 @@ from src.components.health import Health
 from src.components.stamina import Stamina
 from src.components.transform import Transform
 from src.components.physics import Physics
+from src.components.ink_currency import InkCurrency
 from src.core.settings import COLORS
 
+TEXT_CACHE_SIZE = 64  # Rendered strings kept before the oldest is evicted
+
+# Bar geometry: (x, y, width, height) and border width
+HEALTH_BAR = (20, 20, 200, 20)
+HEALTH_BAR_BORDER = 2
+STAMINA_BAR = (20, 60, 200, 15)
+STAMINA_BAR_BORDER = 1
+
+# Left HUD panel (bars, labels, debug lines) cached as one surface at the screen origin
+HUD_PANEL_SIZE = (400, 180)
+
+
+def _fill_width(bar_width, current, maximum):
+    """Bar fill width from the displayed (integer) values, in integer math"""
+    return bar_width * current // maximum if maximum > 0 else 0
+
+
+def _health_color(current, maximum):
+    """Health bar color by level: above 60% green, above 30% yellow, else red"""
+    if 5 * current > 3 * maximum:
+        return (0, 255, 0)  # Green
+    if 10 * current > 3 * maximum:
+        return (255, 255, 0)  # Yellow
+    return (255, 0, 0)  # Red
+
 
 class UISystem(System):
     """System for rendering UI elements"""
@@ -16,16 +42,52 @@ class UISystem(System):
     def __init__(self):
         super().__init__()
         self.screen = None
+        self._screen_width = 0  # Cached when the screen surface is set
+        self._screen_height = 0
         self.font = None
+        self._player = None  # Bound components of the first tracked entity with Health and Stamina
+        self._text_cache = {}  # (text, color) -> rendered Surface, insertion ordered for FIFO eviction
+        self._ui_chassis = None  # Static bar backgrounds and borders, drawn once
+        self._bar_strips = {}  # (color, width, height) -> solid fill strip, blitted partially
+        self._hud_panel = None  # Composite of the left HUD panel, redrawn only when its state changes
+        self._hud_state = None  # Everything the cached panel was drawn from
         
     def set_screen(self, screen):
-        """Set screen surface for rendering"""
-        self.screen = screen
+        """Set screen surface for rendering (its size is cached until a different surface is set)"""
+        if screen is not self.screen:
+            self.screen = screen
+            self._screen_width, self._screen_height = screen.get_size()
         # Initialize font
         if not self.font:
             pygame.font.init()
             self.font = pygame.font.Font(None, 24)
     
+    def _build_chassis(self):
+        """Pre-render the static parts of the health and stamina bars"""
+        chassis = pygame.Surface((240, 120), pygame.SRCALPHA)
+        for bar, border in ((HEALTH_BAR, HEALTH_BAR_BORDER), (STAMINA_BAR, STAMINA_BAR_BORDER)):
+            bg_rect = pygame.Rect(bar)
+            pygame.draw.rect(chassis, COLORS['ui_bar'], bg_rect)
+            pygame.draw.rect(chassis, COLORS['ui_text'], bg_rect, border)
+        if pygame.display.get_surface() is not None:
+            chassis = chassis.convert_alpha()
+        return chassis
+    
+    def _fill_bar(self, surface, bar, border, fill_width, color):
+        """Draw a bar's fill inside its border (the chassis border stays visible on top)"""
+        bar_x, bar_y, bar_width, bar_height = bar
+        inner_width = min(fill_width, bar_width - border) - border
+        if inner_width > 0:
+            # Blit the needed width of a pre-filled full-length strip
+            strip_size = (bar_width - 2 * border, bar_height - 2 * border)
+            key = (color, strip_size)
+            strip = self._bar_strips.get(key)
+            if strip is None:
+                strip = pygame.Surface(strip_size)
+                strip.fill(color)
+                self._bar_strips[key] = strip
+            surface.blit(strip, (bar_x + border, bar_y + border), (0, 0, inner_width, strip_size[1]))
+    
     def update(self, dt: float):
         """Update UI elements"""
         # UI elements are static for now
@@ -34,156 +96,194 @@ class UISystem(System):
     def render(self, screen=None):
         """Render UI elements"""
         if screen:
-            self.screen = screen
+            self.set_screen(screen)
             
         if not self.screen:
             return
             
-        # Find player entity (assuming first entity with both health and stamina)
-        player_entity = None
-        for entity in self.entities:
-            if (entity.has_component(Health) and 
-                entity.has_component(Stamina)):
-                player_entity = entity
-                break
-        
-        if not player_entity:
+        # Player and its components are resolved when entities are added/removed, not per frame
+        if self._player is None:
             return
+        _, health, stamina, transform, physics, ink_currency = self._player
             
-        # Render health and stamina bars
-        self._render_health_bar(player_entity)
-        self._render_stamina_bar(player_entity)
+        # Redraw the left panel only when something it shows has changed
+        hud_state = self._get_hud_state(health, stamina, transform, physics)
+        if self._hud_panel is None or hud_state != self._hud_state:
+            self._redraw_hud_panel(health, stamina, transform, physics)
+            self._hud_state = hud_state
+        self.screen.blit(self._hud_panel, (0, 0))
         
         # Render ink display
-        self._render_ink_display(player_entity)
+        self._render_ink_display(ink_currency)
+    
+    def _get_hud_state(self, health, stamina, transform, physics):
+        """Snapshot the values the left HUD panel is drawn from"""
+        # Bars and labels are drawn from the integer values alone
+        health_state = None
+        if health:
+            health_state = (int(health.current_health), int(health.max_health))
+        stamina_state = None
+        if stamina:
+            stamina_state = (int(stamina.current_stamina), int(stamina.max_stamina), stamina.is_regenerating)
+        position_state = None
+        if transform:
+            position_state = (int(transform.position.x), int(transform.position.y))
+        physics_state = None
+        if physics:
+            # Formatted like the debug text so "-0.0" and "0.0" stay distinct
+            physics_state = (f"{physics.velocity.x:.1f}", f"{physics.velocity.y:.1f}", physics.on_ground)
+        return (health_state, stamina_state, position_state, physics_state, self.font is not None)
+    
+    def _redraw_hud_panel(self, health, stamina, transform, physics):
+        """Draw bars, labels and debug lines into the cached panel surface"""
+        if self._ui_chassis is None:
+            self._ui_chassis = self._build_chassis()
+        if self._hud_panel is None:
+            self._hud_panel = pygame.Surface(HUD_PANEL_SIZE, pygame.SRCALPHA)
+            
+        panel = self._hud_panel
+        panel.fill((0, 0, 0, 0))
+        
+        # Static bar backgrounds and borders
+        panel.blit(self._ui_chassis, (0, 0))
+        
+        # Render health and stamina bars
+        self._render_health_bar(panel, health)
+        self._render_stamina_bar(panel, stamina)
         
         # Render debug info
-        self._render_debug_info(player_entity)
+        self._render_debug_info(panel, transform, physics)
+    
+    def _render_text(self, text, color):
+        """Render text with the UI font, reusing the surface while the string is unchanged"""
+        key = (text, tuple(color))
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self.font.render(text, True, color)
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.pop(next(iter(self._text_cache)))
+            self._text_cache[key] = surface
+        return surface
     
-    def _render_health_bar(self, entity):
+    def _render_health_bar(self, surface, health):
         """Render health bar"""
-        health = entity.get_component(Health)
         if not health:
             return
             
         # Health bar position and size
-        bar_x = 20
-        bar_y = 20
-        bar_width = 200
-        bar_height = 20
+        bar_x, bar_y, bar_width, _ = HEALTH_BAR
         
-        # Background
-        bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(self.screen, COLORS['ui_bar'], bg_rect)
+        current_health = int(health.current_health)
+        max_health = int(health.max_health)
         
-        # Health fill
-        health_percent = health.get_health_percent()
-        fill_width = int(bar_width * health_percent)
+        # Health fill (color changes based on health level)
+        fill_width = _fill_width(bar_width, current_health, max_health)
         if fill_width > 0:
-            fill_rect = pygame.Rect(bar_x, bar_y, fill_width, bar_height)
-            # Health bar color changes based on health level
-            if health_percent > 0.6:
-                color = (0, 255, 0)  # Green
-            elif health_percent > 0.3:
-                color = (255, 255, 0)  # Yellow
-            else:
-                color = (255, 0, 0)  # Red
-            pygame.draw.rect(self.screen, color, fill_rect)
-        
-        # Border
-        pygame.draw.rect(self.screen, COLORS['ui_text'], bg_rect, 2)
+            color = _health_color(current_health, max_health)
+            self._fill_bar(surface, HEALTH_BAR, HEALTH_BAR_BORDER, fill_width, color)
         
         # Text
         if self.font:
-            text = f"Health: {int(health.current_health)}/{int(health.max_health)}"
-            text_surface = self.font.render(text, True, COLORS['ui_text'])
-            self.screen.blit(text_surface, (bar_x, bar_y - 25))
+            text = f"Health: {current_health}/{max_health}"
+            text_surface = self._render_text(text, COLORS['ui_text'])
+            surface.blit(text_surface, (bar_x, bar_y - 25))
     
-    def _render_stamina_bar(self, entity):
+    def _render_stamina_bar(self, surface, stamina):
         """Render stamina bar"""
-        stamina = entity.get_component(Stamina)
         if not stamina:
             return
             
         # Stamina bar position and size
-        bar_x = 20
-        bar_y = 60
-        bar_width = 200
-        bar_height = 15
+        bar_x, bar_y, bar_width, _ = STAMINA_BAR
         
-        # Background
-        bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(self.screen, COLORS['ui_bar'], bg_rect)
+        current_stamina = int(stamina.current_stamina)
+        max_stamina = int(stamina.max_stamina)
         
         # Stamina fill
-        stamina_percent = stamina.get_stamina_percent()
-        fill_width = int(bar_width * stamina_percent)
+        fill_width = _fill_width(bar_width, current_stamina, max_stamina)
         if fill_width > 0:
-            fill_rect = pygame.Rect(bar_x, bar_y, fill_width, bar_height)
             # Stamina bar color
             if stamina.is_regenerating:
                 color = (0, 200, 255)  # Light blue when regenerating
             else:
                 color = (0, 150, 255)  # Blue
-            pygame.draw.rect(self.screen, color, fill_rect)
-        
-        # Border
-        pygame.draw.rect(self.screen, COLORS['ui_text'], bg_rect, 1)
+            self._fill_bar(surface, STAMINA_BAR, STAMINA_BAR_BORDER, fill_width, color)
         
         # Text
         if self.font:
-            text = f"Stamina: {int(stamina.current_stamina)}/{int(stamina.max_stamina)}"
-            text_surface = self.font.render(text, True, COLORS['ui_text'])
-            self.screen.blit(text_surface, (bar_x, bar_y - 20))
+            text = f"Stamina: {current_stamina}/{max_stamina}"
+            text_surface = self._render_text(text, COLORS['ui_text'])
+            surface.blit(text_surface, (bar_x, bar_y - 20))
     
-    def _render_ink_display(self, entity):
+    def _render_ink_display(self, ink_currency):
         """Render ink currency display"""
-        from src.components.ink_currency import InkCurrency
-        
-        ink_currency = entity.get_component(InkCurrency)
         if not ink_currency:
             return
         
         # Text
         if self.font:
             text = f"Ink: {int(ink_currency.current_ink)}"
-            text_surface = self.font.render(text, True, COLORS['ink_drop'])
+            text_surface = self._render_text(text, COLORS['ink_drop'])
             
             # Position in top right corner
-            display_x = self.screen.get_width() - text_surface.get_width() - 20
+            display_x = self._screen_width - text_surface.get_width() - 20
             display_y = 20
             
             self.screen.blit(text_surface, (display_x, display_y))
     
-    def _render_debug_info(self, entity):
+    def _render_debug_info(self, surface, transform, physics):
         """Render debug information"""
         if not self.font:
             return
             
-        # Get components for debug info
-        transform = entity.get_component(Transform)
-        physics = entity.get_component(Physics)
-        
         debug_y = 100
         line_height = 20
         
         if transform:
             pos_text = f"Position: ({int(transform.position.x)}, {int(transform.position.y)})"
-            text_surface = self.font.render(pos_text, True, COLORS['ui_text'])
-            self.screen.blit(text_surface, (20, debug_y))
+            text_surface = self._render_text(pos_text, COLORS['ui_text'])
+            surface.blit(text_surface, (20, debug_y))
             debug_y += line_height
             
         if physics:
             vel_text = f"Velocity: ({physics.velocity.x:.1f}, {physics.velocity.y:.1f})"
-            text_surface = self.font.render(vel_text, True, COLORS['ui_text'])
-            self.screen.blit(text_surface, (20, debug_y))
+            text_surface = self._render_text(vel_text, COLORS['ui_text'])
+            surface.blit(text_surface, (20, debug_y))
             debug_y += line_height
             
             ground_text = f"On Ground: {physics.on_ground}"
-            text_surface = self.font.render(ground_text, True, COLORS['ui_text'])
-            self.screen.blit(text_surface, (20, debug_y))
+            text_surface = self._render_text(ground_text, COLORS['ui_text'])
+            surface.blit(text_surface, (20, debug_y))
     
     def add_entity(self, entity):
         """Add entity to UI system"""
         # UI system tracks entities for stats display
-        super().add_entity(entity)
\ No newline at end of file
+        super().add_entity(entity)
+        if self._player is None and self._is_player(entity):
+            self._player = self._bound[id(entity)]
+    
+    def remove_entity(self, entity):
+        """Remove entity and find a new player to display if it was the player"""
+        super().remove_entity(entity)
+        if self._player is not None and self._player[0] is entity:
+            self._player = self._find_player()
+    
+    def _is_player(self, entity):
+        """Check if entity shows on the HUD (has both health and stamina)"""
+        return entity.has_component(Health) and entity.has_component(Stamina)
+    
+    def _find_player(self):
+        """Find player entity (assuming first entity with both health and stamina)"""
+        for entity in self.entities:
+            if self._is_player(entity):
+                return self._bound[id(entity)]
+        return None
+    
+    def _bind(self, entity):
+        """Cache the components shown on the HUD"""
+        return (entity,
+                entity.get_component(Health),
+                entity.get_component(Stamina),
+                entity.get_component(Transform),
+                entity.get_component(Physics),
+                entity.get_component(InkCurrency))
\ No newline at end of file
@@ -17,7 +17,7 @@ def lerp(start: float, end: float, t: float) -> float:
 
 def distance(pos1: pygame.Vector2, pos2: pygame.Vector2) -> float:
     """Calculate distance between two points"""
-    return (pos2 - pos1).length()
+    return math.hypot(pos2.x - pos1.x, pos2.y - pos1.y)
 
 
 def angle_between(vec1: pygame.Vector2, vec2: pygame.Vector2) -> float:
@@ -27,8 +27,5 @@ def angle_between(vec1: pygame.Vector2, vec2: pygame.Vector2) -> float:
 
 def normalize_angle(angle: float) -> float:
     """Normalize angle to -π to π range"""
-    while angle > math.pi:
-        angle -= 2 * math.pi
-    while angle < -math.pi:
-        angle += 2 * math.pi
-    return angle
\ No newline at end of file
+    # IEEE remainder wraps in constant time regardless of how far out the angle is
+    return math.remainder(angle, math.tau)
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Spatial hash grid for fast rectangle proximity queries
+"""
+import pygame
+from typing import Dict, List, Tuple, Any
+
+
+class SpatialHashGrid:
+    """Uniform grid that buckets items by the cells their bounds overlap"""
+
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Any]] = {}
+        self._item_cells: Dict[int, List[Tuple[int, int]]] = {}  # id(item) -> occupied cells
+        self.version = 0  # Bumped whenever contents change, so callers can drop cached lookups
+
+    def _cells_for(self, rect: pygame.Rect) -> List[Tuple[int, int]]:
+        """Get every cell key overlapped by a rectangle"""
+        cs = self.cell_size
+        x0 = rect.left // cs
+        x1 = (rect.right - 1) // cs
+        y0 = rect.top // cs
+        y1 = (rect.bottom - 1) // cs
+        return [(i, j) for i in range(x0, x1 + 1) for j in range(y0, y1 + 1)]
+
+    def insert(self, item, rect: pygame.Rect):
+        """Insert an item into every cell its bounds overlap"""
+        if id(item) in self._item_cells:
+            self.remove(item)
+
+        keys = self._cells_for(rect)
+        for key in keys:
+            bucket = self.cells.get(key)
+            if bucket is None:
+                self.cells[key] = [item]
+            else:
+                bucket.append(item)
+        self._item_cells[id(item)] = keys
+        self.version += 1
+
+    def remove(self, item):
+        """Remove an item from the grid"""
+        keys = self._item_cells.pop(id(item), None)
+        if keys is None:
+            return
+
+        for key in keys:
+            bucket = self.cells[key]
+            bucket.remove(item)
+            if not bucket:
+                del self.cells[key]
+        self.version += 1
+
+    def query(self, rect: pygame.Rect) -> List[Any]:
+        """Get unique items in the cells overlapped by a rectangle (read-only)"""
+        keys = self._cells_for(rect)
+        if len(keys) == 1:
+            return self.cells.get(keys[0], [])
+
+        found = {}
+        for key in keys:
+            bucket = self.cells.get(key)
+            if bucket:
+                for item in bucket:
+                    found[id(item)] = item
+        return list(found.values())
+
+    def clear(self):
+        """Remove all items"""
+        self.cells.clear()
+        self._item_cells.clear()
+        self.version += 1
+
+    def __contains__(self, item) -> bool:
+        return id(item) in self._item_cells
+
+    def __len__(self) -> int:
+        return len(self._item_cells)